@@ -1,6 +1,7 @@
 """ Asynchronous connection class """
 
 import asyncio
+import socket
 from ssl import SSLContext
 from types import TracebackType
 from typing import Optional, Any, Generator, Type, Mapping
@@ -72,6 +73,10 @@ class AsyncConnection(BaseConnection):
             conn = await loop.create_connection(
                 AsyncPGProtocol, self.host, self.port,
                 local_addr=self._local_addr)
+            # asyncio already disables Nagle for TCP, keepalive is not on by
+            # default.
+            conn[0].get_extra_info("socket").setsockopt(
+                socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         protocol = conn[1]
         if ssl_mode is SSLMode.PREFER or ssl_mode is SSLMode.REQUIRE:
             ssl_ok = await protocol.start_tls(
@@ -83,21 +88,23 @@ class AsyncConnection(BaseConnection):
     async def _connect(self, ssl_mode: SSLMode) -> 'AsyncConnection':
         if self._protocol is not None:
             raise ValueError("Connection has been awaited already")
-        self._protocol = await self._connect_protocol(ssl_mode)
-        self._notify_queue = self._protocol.notify_queue
-        try:
-            await self._protocol.startup(
-                self._user, self._database, "pagio", self._tz_name,
-                self._password, prepare_threshold=self._prepare_threshold,
-                options=self._options, cache_size=self._cache_size)
-        except ServerError as ex:
-            if ex.code == '28000' and ssl_mode == SSLMode.ALLOW:
-                # Exception might be caused by SSL being required. Retry with
-                # SSL.
-                self._protocol = None
-                return await self._connect(ssl_mode=SSLMode.REQUIRE)
-            raise
-        return self
+        while True:
+            protocol = await self._connect_protocol(ssl_mode)
+            try:
+                await protocol.startup(
+                    self._user, self._database, "pagio", self._tz_name,
+                    self._password, prepare_threshold=self._prepare_threshold,
+                    options=self._options, cache_size=self._cache_size)
+            except ServerError as ex:
+                if ex.code != '28000' or ssl_mode is not SSLMode.ALLOW:
+                    raise
+            else:
+                self._protocol = protocol
+                self._notify_queue = protocol.notify_queue
+                return self
+            # Exception might be caused by SSL being required. Retry once
+            # with SSL, outside of the exception handler.
+            ssl_mode = SSLMode.REQUIRE
 
     async def cancel(self) -> None:
         """ Cancels an executing statement. """
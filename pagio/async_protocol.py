@@ -7,7 +7,7 @@ from asyncio import (
 from collections import deque
 from inspect import isawaitable
 from io import TextIOBase
-from ssl import SSLContext, PROTOCOL_TLS_CLIENT, VerifyMode
+from ssl import SSLContext
 from typing import (
     Optional, Any, Union, cast, List, Tuple, Callable, Awaitable, Coroutine,
     Deque, Mapping, Set,
@@ -18,7 +18,9 @@ import scramp
 from .base_protocol import (
     _BasePGProtocol, PyBasePGProtocol, TransactionStatus, _STATUS_CONNECTED,
     _STATUS_CLOSED, _STATUS_READY_FOR_QUERY, _STATUS_SSL_REQUESTED,
-    _STATUS_EXECUTING, _STATUS_CLOSING)
+    _STATUS_EXECUTING, _STATUS_CLOSING, COPY_CHUNK_SIZE, COPY_DONE_MSG,
+    COPY_DONE_SYNC_MSG, COPY_FAIL_MSG, COPY_FAIL_SYNC_MSG,
+    default_ssl_context)
 from .common import (
     ResultSet, CachedQueryExpired, Format, StatementDoesNotExist, CopyFile,
     Notification, InterfaceError, ServerError, Severity, int4_to_bytes,
@@ -212,7 +214,7 @@ class _AsyncPGProtocol(_BasePGProtocol):
 
         while True:
             success, data = await self._copy_in_run_and_check(
-                read_method(8192), read_fut)
+                read_method(COPY_CHUNK_SIZE), read_fut)
             if not success:
                 break
             if isinstance(data, str):
@@ -221,12 +223,9 @@ class _AsyncPGProtocol(_BasePGProtocol):
                 raise Exception("No bytes")
             if not data:
                 # End of file, tell server
-                if self._extended_query:
-                    # CopyDone + Sync message
-                    msg = b'c\x00\x00\x00\x04S\x00\x00\x00\x04'
-                else:
-                    # CopyDone message
-                    msg = b'c\x00\x00\x00\x04'
+                msg = (
+                    COPY_DONE_SYNC_MSG if self._extended_query
+                    else COPY_DONE_MSG)
                 write_task = self._create_task(self.write(msg))
                 await wait((read_fut, write_task), return_when=FIRST_COMPLETED)
                 break
@@ -249,11 +248,8 @@ class _AsyncPGProtocol(_BasePGProtocol):
             # notify server.
             self._ex = ex
             # Send copy fail
-            if self._extended_query:
-                # CopyFail and Sync
-                msg = b'f\0\0\0\x05\0S\x00\x00\x00\x04'
-            else:
-                msg = b'f\0\0\0\x05\0'  # CopyFail message
+            msg = (
+                COPY_FAIL_SYNC_MSG if self._extended_query else COPY_FAIL_MSG)
             await self.write(msg)
 
     def connection_made(self, transport: BaseTransport) -> None:
@@ -311,9 +307,7 @@ class _AsyncPGProtocol(_BasePGProtocol):
         self._status = _STATUS_CONNECTED
         if ssl_ok:
             if not isinstance(ssl, SSLContext):
-                ssl = SSLContext(PROTOCOL_TLS_CLIENT)
-                ssl.check_hostname = False
-                ssl.verify_mode = VerifyMode.CERT_NONE
+                ssl = default_ssl_context()
             self._transport = cast(Transport, await self._loop.start_tls(
                 self._transport, cast(BaseProtocol, self), ssl,
                 server_hostname=server_hostname,
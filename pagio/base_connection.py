@@ -16,6 +16,8 @@ from .types import ResConverter
 
 HAS_AF_UNIX = hasattr(socket, "AF_UNIX")
 
+server_version_re = re.compile(r"(\d+)\.(\d+)")
+
 
 class SSLMode(Enum):
     """ SSL mode of connection """
@@ -275,7 +277,7 @@ class BaseConnection:  # pylint: disable=too-many-instance-attributes
         if self._protocol is None:
             raise ValueError("Connection not established")
         version_str = self._protocol.server_parameters["server_version"]
-        match = re.match(r"(\d+)\.(\d+)", version_str)
+        match = server_version_re.match(version_str)
         if match is None:
             raise ValueError("Can not parse server version string.")
         return int(match.group(1)) * 10000 + int(match.group(2))
@@ -5,13 +5,15 @@ from codecs import decode
 from collections import OrderedDict
 from datetime import tzinfo
 import enum
+from functools import lru_cache
 from hashlib import md5
-from itertools import repeat
+from itertools import islice
+from ssl import SSLContext, PROTOCOL_TLS_CLIENT, VerifyMode
 from struct import Struct, pack
 import sys
 from typing import (
-    Optional, Union, Dict, Callable, List, Any, Tuple, cast, Generator,
-    Type, OrderedDict as TypingOrderedDict, Iterable, Mapping)
+    Optional, Union, Dict, Callable, List, Any, Tuple, cast, Type,
+    OrderedDict as TypingOrderedDict, Mapping)
 import warnings
 
 from .pgscramp import PGScrampClient
@@ -36,11 +38,31 @@ else:
 
 warnings.filterwarnings("ignore", category=ServerNotice, append=True)
 
-STANDARD_BUF_SIZE = 0x4000
+STANDARD_BUF_SIZE = 0x10000
+# size of the chunks read from a file for COPY FROM STDIN
+COPY_CHUNK_SIZE = 0x10000
+# fixed messages to end COPY FROM STDIN, with a Sync for the extended protocol
+COPY_DONE_MSG = b'c\x00\x00\x00\x04'
+COPY_DONE_SYNC_MSG = COPY_DONE_MSG + b'S\x00\x00\x00\x04'
+COPY_FAIL_MSG = b'f\0\0\0\x05\0'
+COPY_FAIL_SYNC_MSG = COPY_FAIL_MSG + b'S\x00\x00\x00\x04'
+
+
+@lru_cache(maxsize=1)
+def default_ssl_context() -> SSLContext:
+    """ Shared SSL context without verification, used when none is given.
+    Do not alter it. """
+    ssl = SSLContext(PROTOCOL_TLS_CLIENT)
+    ssl.check_hostname = False
+    ssl.verify_mode = VerifyMode.CERT_NONE
+    return ssl
 
 
 field_desc_struct = Struct("!IhIhih")
 
+# command tags of statements that drop all server side prepared statements
+_CACHE_RESET_TAGS = frozenset(("DISCARD ALL", "DEALLOCATE ALL"))
+
 
 _STATUS_CLOSED = 0
 _STATUS_CLOSING = 1
@@ -503,6 +525,7 @@ class PyBasePGProtocol(_AbstractPGProtocol):
         self.res_fields: Optional[Tuple[FieldInfo, ...]] = None
         self.res_converters: Optional[
             List[Tuple[ResConverter[Any], ResConverter[Any]]]] = None
+        self._row_converters: Optional[List[ResConverter[Any]]] = None
         self._result_format = Format.DEFAULT
         self._raw_result = False
         self._extended_query = False
@@ -682,6 +705,7 @@ class PyBasePGProtocol(_AbstractPGProtocol):
                         self.res_fields = cache_item["res_fields"]
                         if self.res_fields is not None:
                             self.res_converters = cache_item["res_converters"]
+                            self._row_converters = None
                             self.res_rows = []
                 else:
                     if cache_item["num_executed"] == self._prepare_threshold:
@@ -712,8 +736,7 @@ class PyBasePGProtocol(_AbstractPGProtocol):
 
         if parameters:
             (param_oids, param_structs, param_vals, param_lens,
-             param_fmts) = zip(
-                *(self.convert_param(p) for p in parameters))
+             param_fmts) = zip(*map(self.convert_param, parameters))
         else:
             param_oids = cast(Tuple[int, ...], ())
             param_structs = param_vals = param_lens = param_fmts = ()
@@ -823,11 +846,10 @@ class PyBasePGProtocol(_AbstractPGProtocol):
                 raise ProtocolError("Invalid row description")
             field_name = decode(msg_buf[offset:zero_idx])
             offset = zero_idx + 1
-            table_oid, col_num, type_oid, type_size, type_mod, _format = (
-                field_desc_struct.unpack_from(msg_buf, offset))
-            res_fields.append(FieldInfo(
-                field_name, table_oid, col_num, type_oid, type_size, type_mod,
-                _format))
+            field_info = FieldInfo._make((
+                field_name, *field_desc_struct.unpack_from(msg_buf, offset)))
+            res_fields.append(field_info)
+            type_oid = field_info.type_oid
             convs = self._custom_res_converters.get(type_oid)
             if convs is None:
                 convs = res_converters.get(type_oid, default_res_converters)
@@ -838,6 +860,7 @@ class PyBasePGProtocol(_AbstractPGProtocol):
         self.res_fields = (*res_fields,)
         self.res_rows = []
         self.res_converters = converters
+        self._row_converters = None
         if self._cache_item is not None and self._cache_item["prepared"]:
             # store field_info and converters in cache
             self._cache_item["res_converters"] = converters
@@ -848,35 +871,40 @@ class PyBasePGProtocol(_AbstractPGProtocol):
         if self.res_converters is None or self.res_rows is None:
             raise ProtocolError("Unexpected data row.")
 
-        num_converters = len(self.res_converters)
-        if uint_from_bytes(buf[:2]) != num_converters:
+        row_converters = self._row_converters
+        if row_converters is None:
+            # Pick the converters for this result set once, instead of for
+            # every row.
+            if self._raw_result:
+                row_converters = [
+                    default_res_converters[self._result_format]
+                ] * len(self.res_converters)
+            else:
+                res_format = self._result_format
+                row_converters = [
+                    convs[res_format] for convs in self.res_converters]
+            self._row_converters = row_converters
+
+        if uint_from_bytes(buf[:2]) != len(row_converters):
             raise ProtocolError("Invalid number of row values")
 
-        res_converters: Iterable[ResConverter[Any]]
-        if self._raw_result:
-            res_converters = repeat(
-                default_res_converters[self._result_format], num_converters)
-        else:
-            res_converters = (
-                convs[self._result_format] for convs in self.res_converters)
-
-        def get_vals() -> Generator[Any, None, None]:
-            offset = 2
-            for converter in res_converters:
-                val_len = int_from_bytes(buf[offset:offset + 4])
-                offset += 4
-                if val_len == -1:
-                    yield None
-                elif val_len < 0:
-                    raise ProtocolError("Negative length value")
-                else:
-                    val = converter(self, buf[offset:offset + val_len])
-                    offset += val_len
-                    yield val
-            if offset != len(buf):
-                raise ProtocolError("Additional data after data row")
+        vals: List[Any] = []
+        append = vals.append
+        offset = 2
+        for converter in row_converters:
+            val_len = int_from_bytes(buf[offset:offset + 4])
+            offset += 4
+            if val_len == -1:
+                append(None)
+            elif val_len < 0:
+                raise ProtocolError("Negative length value")
+            else:
+                append(converter(self, buf[offset:offset + val_len]))
+                offset += val_len
+        if offset != len(buf):
+            raise ProtocolError("Additional data after data row")
 
-        self.res_rows.append(tuple(get_vals()))
+        self.res_rows.append((*vals,))
 
     def handle_command_complete(self, msg_buf: memoryview) -> None:
         """ Handles a Command Complete message. """
@@ -885,12 +913,13 @@ class PyBasePGProtocol(_AbstractPGProtocol):
         if self._result is None:
             raise ProtocolError("Unexpected close message.")
         command_tag = decode(msg_buf[:-1])
-        if command_tag in ("DISCARD ALL", "DEALLOCATE ALL"):
+        if command_tag in _CACHE_RESET_TAGS:
             self._cache.clear()
         self._result.append((
             self.res_fields, self.res_rows, command_tag))
         self.res_fields = None
         self.res_converters = None
+        self._row_converters = None
         self.res_rows = None
 
     # pylint: disable-next=too-many-branches
@@ -906,14 +935,22 @@ class PyBasePGProtocol(_AbstractPGProtocol):
         if cache_item is None:
             # Statement does not exist in cache
             if (self._ex is None and len(self._result) == 1 and
-                    self._result[0][2] not in (
-                        "DISCARD ALL", "DEALLOCATE ALL")):
+                    self._result[0][2] not in _CACHE_RESET_TAGS):
                 # Successful execution, new item must be added to cache.
                 cache_len = len(self._cache)
                 if cache_len == self._cache_size:
                     # Cache is full. Remove old statement, reuse statement
-                    # name and close old statement if prepared
-                    old_item = self._cache.popitem(last=False)[1]
+                    # name and close old statement if prepared.
+                    # Prefer the oldest statement that is not prepared in the
+                    # older half of the cache, so a burst of single use
+                    # statements does not push out the prepared ones.
+                    old_key = next(iter(self._cache))
+                    for key, item in islice(
+                            self._cache.items(), cache_len // 2):
+                        if not item["prepared"]:
+                            old_key = key
+                            break
+                    old_item = self._cache.pop(old_key)
                     stmt_name = old_item["name"]
                     if old_item["prepared"]:
                         self._stmt_to_close = old_item
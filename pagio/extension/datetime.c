@@ -813,6 +813,7 @@ _convert_pg_timestamp_bin(PPObject *self, char *buf, int len, int use_tz) {
 
     int64_t val;
     int32_t year, month, day, hour, minute, second, usec;
+    int usec_digits;
     char *bc_str, *tz_str, usec_str[8];
 
     if (len != 8) {
@@ -931,12 +932,14 @@ _convert_pg_timestamp_bin(PPObject *self, char *buf, int len, int use_tz) {
         bc_str = " BC";
     }
 
-    // strip trailing millisecond zeroes
+    // strip trailing microsecond zeroes, keep the leading ones
+    usec_digits = 6;
     while (usec && usec % 10 == 0) {
         usec = usec / 10;
+        usec_digits--;
     }
     if (usec)
-        sprintf(usec_str, ".%i", usec);
+        sprintf(usec_str, ".%0*i", usec_digits, usec);
     else
         usec_str[0] = '\0';
 
@@ -84,7 +84,7 @@ read_string(char **ptr, char *end) {
 }
 
 
-#define STANDARD_BUF_SIZE 0x4000
+#define STANDARD_BUF_SIZE 0x10000
 
 
 static inline int get_buf_size(PPObject *self) {
@@ -963,14 +963,32 @@ ready_cache(PPObject *self) {
 
         if (cache_size == self->cache_size) {
             // Cache is full, remove oldest one
-            Py_ssize_t ppos = 0;
-            PyObject *old_key, *old_cache_item;
-            Py_hash_t old_hash;
+            Py_ssize_t ppos = 0, i;
+            PyObject *old_key, *old_cache_item, *key, *cache_item;
+            Py_hash_t old_hash, hash;
 
             // get oldest item from cache
             _PyDict_Next(
                 self->stmt_cache, &ppos, &old_key, &old_cache_item, &old_hash);
 
+            if (PagioST_PREPARED(old_cache_item)) {
+                // Prefer the oldest statement that is not prepared in the
+                // older half of the cache, so a burst of single use
+                // statements does not push out the prepared ones.
+                for (i = 1; i < cache_size / 2; i++) {
+                    if (!_PyDict_Next(
+                            self->stmt_cache, &ppos, &key, &cache_item, &hash)) {
+                        break;
+                    }
+                    if (!PagioST_PREPARED(cache_item)) {
+                        old_key = key;
+                        old_cache_item = cache_item;
+                        old_hash = hash;
+                        break;
+                    }
+                }
+            }
+
             // Reuse statement index
             stmt_index = PagioST_INDEX(old_cache_item);
 
@@ -1,16 +1,86 @@
 """ PG specific SASL client """
 
-from contextlib import contextmanager
-from typing import Union, List, Tuple, Optional, Callable, Any, Generator
+from hashlib import pbkdf2_hmac
+from hmac import digest as hmac_digest
+from typing import Union, List, Tuple, Optional, Callable, Any, Dict
 
 import scramp
 
 
 class _FakePassword(str):
-    """ Placeholder class used for patched version """
+    """ Placeholder for the password. It carries the prepared or raw binary
+    password as used for the key derivation, for the patched version. """
 
+    raw: bytes
 
-_fake_password = _FakePassword()
+    def __new__(cls, raw: bytes) -> '_FakePassword':
+        self = super().__new__(cls)
+        self.raw = raw
+        return self
+
+
+# original scramp implementation, used for all other passwords
+# pylint: disable-next=protected-access
+_orig_make_salted_password = scramp.core._make_salted_password
+
+
+_SALTED_PWD_CACHE_SIZE = 128
+_salted_pwd_cache: Dict[Tuple[str, bytes, int, bytes], bytes] = {}
+
+
+def _salted_pwd(
+        hash_name: str, password: bytes, salt: bytes, iterations: int,
+) -> bytes:
+    # The key derivation is by far the most expensive part of the
+    # authentication and deliberately so. Cache the result for reconnects
+    # with the same credentials and server salt. The password itself is not
+    # kept, the key holds an HMAC of it instead.
+    key = (hash_name, salt, iterations, hmac_digest(salt, password, "sha256"))
+    try:
+        # take it out, to insert it again as the most recently used one
+        salted_pwd = _salted_pwd_cache.pop(key)
+    except KeyError:
+        salted_pwd = pbkdf2_hmac(hash_name, password, salt, iterations)
+        if len(_salted_pwd_cache) >= _SALTED_PWD_CACHE_SIZE:
+            # evict the least recently used one
+            try:
+                del _salted_pwd_cache[next(iter(_salted_pwd_cache))]
+            except (KeyError, StopIteration, RuntimeError):
+                # emptied or changed by another thread in the meantime
+                pass
+    _salted_pwd_cache[key] = salted_pwd
+    return salted_pwd
+
+
+def clear_salted_password_cache() -> None:
+    """ Clears the cache of derived SCRAM passwords """
+    _salted_pwd_cache.clear()
+
+
+def _make_salted_pwd(
+        hf: Callable[[], Any],  # pylint: disable=invalid-name
+        password: str,
+        salt: Any,
+        iterations: int,
+) -> bytes:
+    # Patched version of _make_salted_password. It uses the binary password
+    # value directly if it is marked as a FakePassword, which is how
+    # PGScrampClient passes its already prepared or raw password.
+    # All other values are handed to the original scramp implementation, so
+    # the patch can stay in place in multithreaded systems where other SASL
+    # authentication dialogues take place, also by other users of scramp.
+    if isinstance(password, _FakePassword):
+        # newer scramp versions use an unhashable Salt object
+        return _salted_pwd(hf().name, password.raw, bytes(salt), iterations)
+    return _orig_make_salted_password(hf, password, salt, iterations)
+
+
+def _patch_scramp() -> None:
+    """ Monkey patch scramp library, once """
+    # pylint: disable-next=protected-access
+    if scramp.core._make_salted_password is not _make_salted_pwd:
+        # pylint: disable-next=protected-access
+        scramp.core._make_salted_password = _make_salted_pwd
 
 
 class PGScrampClient:
@@ -34,23 +104,28 @@ class PGScrampClient:
     # can't be prepared using the prescribed algorithm. This is done only when
     # the password can not be prepped.
     #
-    # This implementation tries to use the standard implementation. It can fail
-    # for two reasons.
+    # The password is therefore prepared once, in __init__, as the standard
+    # prescribes: decoded as UTF-8 and run through saslprep. This fails for
+    # two reasons.
     # * The password is not a UTF-8 valid binary string
     # * The UTF-8 valid password contains illegal characters for the saslprep
     #   algorithm
     #
-    # The first condition is detected in the __init__. The second condition is
-    # discovered in "get_client_final". In those cases, the original scramp
-    # implementation is monkey patched (yes... ugly) to cope with raw binary
-    # values.
+    # In those cases the raw binary value is used instead, like PostgreSQL
+    # does. Either way, the resulting bytes are handed to scramp in a
+    # placeholder password. The original scramp implementation is monkey
+    # patched (yes... ugly) to use those bytes directly for the key
+    # derivation, so the preparation is not repeated. The patch is installed
+    # once and left in place. It only behaves differently for the placeholder
+    # password, which carries its own bytes, so concurrent dialogues can not
+    # get mixed up. Everything else, like other users of scramp, is handed to
+    # the original scramp implementation.
     #
     # Note: This is no criticism on the scramp library being used. It follows
     # standards as it should. PostgreSQL needs to deal with legacy and I am too
     # lazy to build a special SASL client myself, when a fully functional
     # lib already exists.
-    # That's why this library needs this ugly monkey patching, but it is only
-    # activated when the particular edge cases are encountered.
+    # That's why this library needs this ugly monkey patching.
     #
     # See: https://www.postgresql.org/docs/current/sasl-authentication.html
 
@@ -59,15 +134,14 @@ class PGScrampClient:
             mechanisms: Union[List[str], Tuple[str]],
             password: bytes,
             channel_binding: Optional[Tuple[str, bytes]]):
-        self._password = password
         try:
-            password_str = password.decode()
-        except UnicodeError:
-            # Password is not valid UTF-8, patching is necessary later on.
-            password_str = _fake_password
+            prepped_pwd = scramp.core.saslprep(password.decode()).encode()
+        except (UnicodeError, scramp.ScramException):
+            # Password can not be prepared, use the raw value.
+            prepped_pwd = password
+        _patch_scramp()
         self._client = scramp.ScramClient(
-            mechanisms, "user", password_str, channel_binding)
-        self._server_first_msg = ""
+            mechanisms, "user", _FakePassword(prepped_pwd), channel_binding)
 
     @property
     def mechanism_name(self) -> str:
@@ -80,69 +154,11 @@ class PGScrampClient:
 
     def set_server_first(self, message: str) -> None:
         """ Set the server first message """
-        self._server_first_msg = message
         self._client.set_server_first(message)
 
-    def _make_salted_pwd(
-            self,
-            hf: Callable[[], Any],  # pylint: disable=invalid-name
-            password: str,
-            salt: bytes,
-            iterations: int,
-    ) -> str:
-        # Patched version of _make_salted_password. It uses the raw binary
-        # password value if it is marked as a FakePassword, which happens when
-        # the regular prep algorithm can not be applied.
-        # For other values, existing functionality is not changed, so it can be
-        # used in multithreaded systems where other SASL authentication
-        # dialogues take place.
-        if password is _fake_password:
-            pwd = self._password
-        else:
-            pwd = scramp.core.saslprep(password).encode()
-        return scramp.utils.hi(hf, pwd, salt, iterations)
-
-    @contextmanager
-    def _patch_make_pwd(self) -> Generator[None, None, None]:
-        """ Monkey patch scramp library """
-
-        # pylint: disable-next=protected-access
-        old_make_pwd = scramp.core._make_salted_password
-        # pylint: disable-next=protected-access
-        scramp.core._make_salted_password = self._make_salted_pwd
-        try:
-            # Patch in place, yield control to caller
-            yield None
-        finally:
-            # Done, revert monkey patch
-            # pylint: disable-next=protected-access
-            scramp.core._make_salted_password = old_make_pwd
-
     def get_client_final(self) -> str:
         """ Gets the final client message. """
-
-        if self._client.password is not _fake_password:
-            # password is valid UTF-8, try to use it
-            try:
-                return self._client.get_client_final()
-            except scramp.ScramException as ex:
-                if ex.server_error != "invalid-encoding":
-                    # Something else went wrong, just raise
-                    raise
-                # Maybe caused by illegal characters for saslprep in
-                # password. Retry with patched version.
-                # Current client can not be used again, so reset the client and
-                # replay auth dialog.
-                self._client = scramp.ScramClient(
-                    [self._client.mechanism_name], "user", _fake_password,
-                    self._client.channel_binding, self._client.c_nonce)
-                self._client.get_client_first()
-                self._client.set_server_first(self._server_first_msg)
-
-        with self._patch_make_pwd():
-            # get the message using the patched variant where the raw password
-            # version is used
-            return self._client.get_client_final()
+        return self._client.get_client_final()
 
     def set_server_final(self, message: str) -> None:
         """ Sets final server message """
@@ -43,7 +43,7 @@ class Connection(BaseConnection):
         self._protocol: Optional[PGProtocol] = self._connect(self._ssl_mode)
         self._notifications = NotificationQueue(self._protocol)
 
-    def _connect(self, ssl_mode: SSLMode) -> PGProtocol:
+    def _connect_protocol(self, ssl_mode: SSLMode) -> PGProtocol:
         # connect socket
         if self._use_af_unix:
             sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM, 0)
@@ -53,6 +53,7 @@ class Connection(BaseConnection):
                 (self.host, self.port), source_address=self._local_addr)
             if HAS_TCP_NODELAY:
                 sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
 
         # Create protocol
         # note: pylint is wrong here because it doesn't read _pagio.pyi file
@@ -63,21 +64,26 @@ class Connection(BaseConnection):
             ssl_ok = prot.start_tls(self._ssl, self._server_hostname)
             if not ssl_ok and ssl_mode is SSLMode.REQUIRE:
                 raise Exception("Server refuses TLS upgrade")
-
-        try:
-            # login
-            prot.startup(
-                self._user, self._database, "pagio", self._password,
-                self._tz_name, self._prepare_threshold, self._options,
-                self._cache_size)
-        except ServerError as ex:
-            if ex.code == '28000' and ssl_mode == SSLMode.ALLOW:
-                # Exception might be caused by SSL being required. Retry with
-                # SSL.
-                return self._connect(ssl_mode=SSLMode.REQUIRE)
-            raise
         return prot
 
+    def _connect(self, ssl_mode: SSLMode) -> PGProtocol:
+        while True:
+            prot = self._connect_protocol(ssl_mode)
+            try:
+                # login
+                prot.startup(
+                    self._user, self._database, "pagio", self._password,
+                    self._tz_name, self._prepare_threshold, self._options,
+                    self._cache_size)
+            except ServerError as ex:
+                if ex.code != '28000' or ssl_mode is not SSLMode.ALLOW:
+                    raise
+            else:
+                return prot
+            # Exception might be caused by SSL being required. Retry once
+            # with SSL, outside of the exception handler.
+            ssl_mode = SSLMode.REQUIRE
+
     @property
     def notifications(self) -> NotificationQueue:
         """ Notification Queue """
@@ -1,24 +1,33 @@
 """ Synchronous version of Protocol """
 
 from collections import deque
-from io import TextIOBase
+from functools import partial
+from io import TextIOBase, FileIO, BufferedWriter, BytesIO
 import socket
-from ssl import SSLContext, PROTOCOL_TLS_CLIENT, VerifyMode, SSLSocket
-from typing import Optional, Union, Any, List, Tuple, Deque, Mapping
+from struct import Struct
+from time import monotonic
+from ssl import SSLContext, SSLSocket
+from typing import (
+    Optional, Union, Any, List, Tuple, Deque, Mapping, Callable)
 
 import scramp
 
 from .base_protocol import (
     _BasePGProtocol, PyBasePGProtocol, _STATUS_READY_FOR_QUERY,
     TransactionStatus, _STATUS_CLOSED, _STATUS_CONNECTED,
-    _STATUS_SSL_REQUESTED, _STATUS_EXECUTING)
+    _STATUS_SSL_REQUESTED, _STATUS_EXECUTING, COPY_CHUNK_SIZE, COPY_DONE_MSG,
+    COPY_DONE_SYNC_MSG, COPY_FAIL_MSG, COPY_FAIL_SYNC_MSG,
+    default_ssl_context)
 from .common import (
     ResultSet, CachedQueryExpired, Format, StatementDoesNotExist, SyncCopyFile,
-    Notification, InterfaceError, ServerError, Severity, int4_to_bytes,
+    Notification, InterfaceError, ServerError, Severity,
 )
 
 
 NO_RESULT = object()
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+# CopyData message header: identifier and message length
+copy_data_header = Struct("!ci").pack
 
 
 class _PGProtocol(_BasePGProtocol):
@@ -27,6 +36,8 @@ class _PGProtocol(_BasePGProtocol):
     _prepare_threshold: int
     _cache_size: int
     file_obj: Optional[SyncCopyFile]
+    _write_method: Callable[[Any], Any]
+    _copy_out_conv: Optional[Callable[[memoryview], Any]]
 
     def __init__(self, sock: socket.socket):
         super().__init__()
@@ -47,17 +58,28 @@ class _PGProtocol(_BasePGProtocol):
         except AttributeError as ex:
             raise ValueError(
                 "Invalid output file, missing write method.") from ex
-        is_text_file = (
-                isinstance(self.file_obj, TextIOBase) or
-                "b" not in getattr(self.file_obj, "mode", "b"))
-        if is_text_file:
-            self._write_method = lambda data: write_method(data.decode())
+        self._write_method = write_method
+        if (isinstance(self.file_obj, TextIOBase) or
+                "b" not in getattr(self.file_obj, "mode", "b")):
+            # decode straight from the buffer, without intermediate bytes
+            self._copy_out_conv = partial(str, encoding="utf-8")
+        elif type(self.file_obj) in (FileIO, BufferedWriter, BytesIO):
+            # These standard types only access the data during the write call,
+            # so the message buffer can be passed without copying. Subclasses
+            # might override write, so those are not trusted.
+            self._copy_out_conv = None
         else:
-            self._write_method = write_method
+            # Other objects might hold on to the data, while the message
+            # buffer gets reused.
+            self._copy_out_conv = bytes
 
     def handle_copy_data_response(self, msg_buf: memoryview) -> None:
         """ Handle a copy data response """
-        self._write_method(bytes(msg_buf))  # type: ignore
+        conv = self._copy_out_conv
+        if conv is None:
+            self._write_method(msg_buf)
+        else:
+            self._write_method(conv(msg_buf))
 
     def handle_copy_done_response(self, msg_buf: memoryview) -> None:
         """ Handle a copy done response """
@@ -66,25 +88,26 @@ class _PGProtocol(_BasePGProtocol):
         if self.file_obj is None:
             raise Exception("I can't")
 
-        read_method = getattr(self.file_obj, "read")
-        if read_method is None:
-            raise ValueError("Invalid input file, missing read method.")
+        try:
+            read_method = self.file_obj.read  # type: ignore
+        except AttributeError as ex:
+            raise ValueError(
+                "Invalid input file, missing read method.") from ex
+        writelines = self.writelines
         while True:
-            data = read_method(4096)
+            data = read_method(COPY_CHUNK_SIZE)
             if isinstance(data, str):
                 data = data.encode()
             elif not isinstance(data, bytes):
                 raise Exception("No bytes")
             if not data:
-                if self._extended_query:
-                    # CopyDone + Sync message
-                    msg = b'c\x00\x00\x00\x04S\x00\x00\x00\x04'
-                else:
-                    # CopyDone message
-                    msg = b'c\x00\x00\x00\x04'
+                msg = (
+                    COPY_DONE_SYNC_MSG if self._extended_query
+                    else COPY_DONE_MSG)
                 self.write(msg)
                 break
-            self.writelines([b'd', int4_to_bytes(len(data) + 4), data])
+            # CopyData message, header and data are gathered by the kernel
+            writelines([copy_data_header(b'd', len(data) + 4), data])
 
     # pylint: disable-next=unused-argument
     def handle_copy_in_response(self, msg_buf: memoryview) -> None:
@@ -96,11 +119,8 @@ class _PGProtocol(_BasePGProtocol):
             # notify server.
             self._ex = ex
             # Send copy fail
-            if self._extended_query:
-                # CopyFail and Sync
-                msg = b'f\0\0\0\x05\0S\x00\x00\x00\x04'
-            else:
-                msg = b'f\0\0\0\x05\0'  # CopyFail message
+            msg = (
+                COPY_FAIL_SYNC_MSG if self._extended_query else COPY_FAIL_MSG)
             self.write(msg)
 
     def start_tls(
@@ -121,9 +141,7 @@ class _PGProtocol(_BasePGProtocol):
         if not ssl_ok:
             return False
         if not isinstance(ssl, SSLContext):
-            ssl = SSLContext(PROTOCOL_TLS_CLIENT)
-            ssl.check_hostname = False
-            ssl.verify_mode = VerifyMode.CERT_NONE
+            ssl = default_ssl_context()
         self.sock.settimeout(ssl_handshake_timeout)
         self.sock = ssl.wrap_socket(
             self.sock, server_hostname=server_hostname)
@@ -180,7 +198,21 @@ class _PGProtocol(_BasePGProtocol):
 
     def writelines(self, data: List[bytes]) -> None:
         """ Send multiple data chunks to the server """
-        self.write(b''.join(data))
+        sock = self.sock
+        if not HAS_SENDMSG or isinstance(sock, SSLSocket):
+            self.write(b''.join(data))
+            return
+        # Let the kernel gather the chunks, instead of joining them first
+        try:
+            num_bytes = sock.sendmsg(data)  # type: ignore
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException:
+            self._close()
+            raise
+        if num_bytes < sum(map(len, data)):
+            # Partial send, send the rest in the regular way
+            self.write(b''.join(data)[num_bytes:])
 
     def poll(self) -> None:
         """ Make a single read pass """
@@ -193,9 +225,10 @@ class _PGProtocol(_BasePGProtocol):
 
     def read(self) -> Any:
         """ Read data from server and handle returned data """
+        poll = self.poll
         while self._sync_result is NO_RESULT:
             try:
-                self.poll()
+                poll()
             except (SystemExit, KeyboardInterrupt):
                 raise
             except BaseException as ex:  # pylint: disable=broad-except
@@ -283,15 +316,29 @@ class NotificationQueue:
 
     def get(self, timeout: Optional[float] = None) -> Notification:
         """ Gets a notification """
-        if self.empty():
-            self._protocol.sock.settimeout(timeout)  # type: ignore
-            while not self._protocol.notify_queue:
-                try:
-                    self._protocol.poll()
-                except (socket.timeout, BlockingIOError) as ex:
-                    raise QueueEmpty from ex
-                finally:
-                    self._protocol.sock.settimeout(None)  # type: ignore
+        protocol = self._protocol
+        if not protocol.notify_queue:
+            # Set the socket timeout once for the whole wait, instead of
+            # switching it on and off around every read.
+            deadline: Optional[float] = None
+            if timeout is not None:
+                deadline = monotonic() + timeout
+            protocol.sock.settimeout(timeout)  # type: ignore
+            try:
+                while not protocol.notify_queue:
+                    try:
+                        protocol.poll()
+                    except (socket.timeout, BlockingIOError) as ex:
+                        raise QueueEmpty from ex
+                    if deadline is not None and not protocol.notify_queue:
+                        # Other data was received, wait for the remainder
+                        remaining = deadline - monotonic()
+                        if remaining <= 0:
+                            raise QueueEmpty
+                        protocol.sock.settimeout(remaining)  # type: ignore
+            finally:
+                if protocol.sock is not None:
+                    protocol.sock.settimeout(None)
 
         return self._protocol.notify_queue.popleft()
 
@@ -142,27 +142,35 @@ class BinArrayConverter(Generic[T]):
             buf: memoryview,
             array_dims: List[int],
     ) -> Tuple[Any, int]:
-        if array_dims:
-            # get an array of (nested) values
-            dim = array_dims[0]
-            i = 0
-            vals = []
+        dim = array_dims[0]
+        i = 0
+        vals: List[Any] = []
+        if len(array_dims) > 1:
+            # get an array of nested arrays
+            sub_dims = array_dims[1:]
             for _ in range(dim):
-                val, pos = self._get_values(prot, buf[i:], array_dims[1:])
+                val, pos = self._get_values(prot, buf[i:], sub_dims)
                 vals.append(val)
                 i += pos
             return vals, i
 
-        # get a single value, either NULL or an actual value prefixed by a
-        # length
-        item_len = int_from_bytes(buf[:4])
-        if item_len == -1:
-            return None, 4
-        full_length = 4 + item_len
-        val_buf = buf[4:full_length]
-        if item_len > len(val_buf):
-            raise ProtocolError("Invalid array value.")
-        return self._converter(prot, val_buf), full_length
+        # innermost dimension, get the values in a single loop. Each value is
+        # either NULL or an actual value prefixed by a length
+        converter = self._converter
+        for _ in range(dim):
+            item_len = int_from_bytes(buf[i:i + 4])
+            i += 4
+            if item_len == -1:
+                vals.append(None)
+                continue
+            if item_len < 0:
+                raise ProtocolError("Invalid array value.")
+            val_buf = buf[i:i + item_len]
+            if item_len > len(val_buf):
+                raise ProtocolError("Invalid array value.")
+            vals.append(converter(prot, val_buf))
+            i += item_len
+        return vals, i
 
     def __call__(
             self,
@@ -194,6 +202,7 @@ class BinArrayConverter(Generic[T]):
 
 
 class PGArray:
+    __slots__ = ("_vals",)
     oid: int = 0
     delimiter: str = ","
     ws_pattern = re.compile("[\\s{}\"\']")
@@ -204,13 +213,15 @@ class PGArray:
     def _val_to_str(self, val: Any) -> str:
         return str(val)
 
-    def _get_vals(self) -> Generator[str, None, None]:
-        for val in self._vals:
+    def _get_vals(self, vals: List[Any]) -> Generator[str, None, None]:
+        for val in vals:
             if val is None:
                 yield "NULL"
                 continue
             if isinstance(val, list):
-                yield str(self.__class__(val))
+                # nested array, serialize in place instead of through a new
+                # instance
+                yield f"{{{self.delimiter.join(self._get_vals(val))}}}"
                 continue
             val = self._val_to_str(val)
             if self.ws_pattern.search(val) or self.delimiter in val:
@@ -220,7 +231,7 @@ class PGArray:
                 yield val
 
     def __str__(self) -> str:
-        return f"{{{self.delimiter.join(self._get_vals())}}}"
+        return f"{{{self.delimiter.join(self._get_vals(self._vals))}}}"
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({repr(self._vals)})"
@@ -1,6 +1,5 @@
 """ Date/time type conversion functions """
 
-from codecs import decode
 from datetime import (
     date, datetime, time, timedelta, timezone, tzinfo as dt_tzinfo)
 import re
@@ -16,7 +15,6 @@ from ..const import (
     TIMESTAMPARRAYOID, TIMESTAMPTZARRAYOID, DATEARRAYOID, TIMEARRAYOID,
     TSRANGEOID, TSTZRANGEOID,
 )
-from .numeric import bin_int_to_python, bin_int8_to_python
 from .range import BasePGRange, DiscreteRange
 from .text import default_to_pg
 
@@ -38,7 +36,7 @@ def txt_date_to_python(
         buf: memoryview,
 ) -> Union[str, date]:
     """ Converts PG textual date value to Python date """
-    date_str = decode(buf)
+    date_str = str(buf, "utf-8")
     if prot._iso_dates and len(date_str) == 10:
         return date.fromisoformat(date_str)
     return date_str
@@ -56,24 +54,27 @@ MIN_PG_TIMESTAMP = MIN_PG_ORDINAL * USECS_PER_DAY
 MAX_PG_TIMESTAMP = (
     MAX_PG_ORDINAL * USECS_PER_DAY + 23 * USECS_PER_HOUR +
     59 * USECS_PER_MINUTE + 59 * USECS_PER_SEC + 999999)
+PG_EPOCH = datetime(2000, 1, 1)
+PG_EPOCH_UTC = PG_EPOCH.replace(tzinfo=timezone.utc)
 MAX_YEAR = date.max.year
 MIN_YEAR = date.min.year
 
 
 def _date_vals_from_int(julian_day: int) -> Tuple[int, int, int]:
 
-    # julian day magic to retrieve day, month and year, inspired by postgres
-    # server code
-    julian = julian_day + 2483589
-    quad, extra = divmod(julian, 146097)
-    extra = extra * 4 + 3
-    julian += 60 + quad * 3 + extra // 146097
-    quad, julian = divmod(julian, 1461)
-    year_val = julian * 4 // 1461
-    julian = ((julian + 305) % 365 if year_val else (julian + 306) % 366) + 123
-    year_val += quad * 4
-    quad = julian * 2141 // 65536
-    return year_val - 4800, (quad + 10) % 12 + 1,  julian - 7834 * quad // 256
+    # Euclidean affine functions by Neri and Schneider. Days are counted from
+    # 0000-03-01, which puts the leap day at the end of the computational year.
+    n = 4 * (julian_day + 730425) + 3
+    century, n = divmod(n, 146097)
+    n = (n | 3) * 2939745
+    year_of_century = n >> 32
+    day_of_year = (n & 0xFFFFFFFF) // 11758980
+    n = 2141 * day_of_year + 197913
+    # January and February belong to the next calendar year
+    jan_feb = day_of_year >= 306
+    return (
+        100 * century + year_of_century + jan_feb, (n >> 16) - 12 * jan_feb,
+        (n & 0xFFFF) // 2141 + 1)
 
 
 def bin_date_to_python(
@@ -81,8 +82,9 @@ def bin_date_to_python(
         buf: memoryview,
 ) -> Union[str, date]:
     """ Converts PG binary date value to Python date """
-
-    pg_ordinal = bin_int_to_python(prot, buf)
+    if len(buf) != 4:
+        raise ProtocolError("Invalid date length.")
+    pg_ordinal = int.from_bytes(buf, "big", signed=True)
 
     if MIN_PG_ORDINAL <= pg_ordinal <= MAX_PG_ORDINAL:
         # within Python date range
@@ -140,7 +142,7 @@ def time_vals_from_txt(time_str: str) -> Tuple[int, int, int, int]:
     if usec is None:
         usec = 0
     else:
-        usec = int(usec + "0" * (6 - len(usec)))
+        usec = int(usec.ljust(6, "0"))
     hour = int(match.group(1))
     if hour == 24:
         hour = 0
@@ -152,7 +154,7 @@ def txt_time_to_python(
         buf: memoryview,
 ) -> time:
     """ Converts PG textual time value to Python time """
-    time_str = decode(buf)
+    time_str = str(buf, "utf-8")
     hour, minute, second, usec = time_vals_from_txt(time_str)
     try:
         return time(hour, minute, second, usec)
@@ -161,13 +163,15 @@ def txt_time_to_python(
 
 
 def _time_vals_from_int(time_val: int) -> Tuple[int, int, int, int]:
-    hour, time_val = divmod(time_val, USECS_PER_HOUR)
-    if time_val < 0 or hour > 24:
+    if time_val < 0:
+        raise ProtocolError("Invalid time value")
+    # split off the microseconds first, the rest is done on small numbers
+    time_val, usec = divmod(time_val, USECS_PER_SEC)
+    hour, time_val = divmod(time_val, 3600)
+    if hour > 24:
         raise ProtocolError("Invalid time value")
-    hour = hour % 24
-    minute, time_val = divmod(time_val, USECS_PER_MINUTE)
-    second, usec = divmod(time_val, USECS_PER_SEC)
-    return hour, minute, second, usec
+    minute, second = divmod(time_val, 60)
+    return hour % 24, minute, second, usec
 
 
 def bin_time_to_python(
@@ -175,8 +179,9 @@ def bin_time_to_python(
         buf: memoryview,
 ) -> time:
     """ Converts PG binary time value to Python time """
-
-    value = bin_int8_to_python(prot, buf)
+    if len(buf) != 8:
+        raise ProtocolError("Invalid time length.")
+    value = int.from_bytes(buf, "big", signed=True)
     return time(*_time_vals_from_int(value))
 
 
@@ -218,7 +223,7 @@ def txt_timetz_to_python(
 ) -> time:
     """ Converts PG textual timetz value to Python time with timezone """
 
-    time_str = decode(buf)
+    time_str = str(buf, "utf-8")
     match = timetz_re.match(time_str)
     if match is None:
         raise ProtocolError("Invalid PG time value.")
@@ -226,7 +231,7 @@ def txt_timetz_to_python(
     if usec is None:
         usec = 0
     else:
-        usec = int(usec + "0" * (6 - len(usec)))
+        usec = int(usec.ljust(6, "0"))
     hour = int(match.group(1))
     if hour == 24:
         hour = 0
@@ -264,6 +269,34 @@ timestamp_re = re.compile(
     re.ASCII)
 
 
+def _ts_vals_from_txt(
+        ts_str: str, ts_len: int,
+) -> Tuple[int, int, int, int, int, int, int]:
+    # Fast path for the layout PG uses for nearly all values,
+    # "YYYY-MM-DD HH:MM:SS[.U{1,6}]", using fixed positions instead of a
+    # regular expression. Raises ValueError for any other layout.
+    if not (19 <= ts_len <= 26 and ts_str[4] == "-" and ts_str[7] == "-" and
+            ts_str[10] == " " and ts_str[13] == ":" and ts_str[16] == ":"):
+        raise ValueError("Unexpected timestamp layout")
+    if ts_len == 19:
+        usec_str = "0"
+    elif ts_len > 20 and ts_str[19] == ".":
+        usec_str = ts_str[20:ts_len]
+    else:
+        raise ValueError("Unexpected timestamp layout")
+    year, month, day = ts_str[:4], ts_str[5:7], ts_str[8:10]
+    hour, minute, sec = ts_str[11:13], ts_str[14:16], ts_str[17:19]
+    # int() also accepts signs, spaces, underscores and non ASCII digits
+    if not (ts_str.isascii() and year.isdigit() and month.isdigit() and
+            day.isdigit() and hour.isdigit() and minute.isdigit() and
+            sec.isdigit() and usec_str.isdigit()):
+        raise ValueError("Unexpected timestamp layout")
+    return (
+        int(year), int(month), int(day), int(hour), int(minute), int(sec),
+        # compensate for missing trailing zeroes
+        int(usec_str.ljust(6, "0")))
+
+
 def txt_timestamp_to_python(
         prot: 'pagio.base_protocol._AbstractPGProtocol',
         buf: memoryview,
@@ -272,11 +305,16 @@ def txt_timestamp_to_python(
     """
     # String is in the form "YYYY[YY..]-MM-DD HH:MM:SS[.U{1,6}][ BC]
     # Python datetime range can only handle 4 digit year without 'BC' suffix
-    ts_str = decode(buf)
+    ts_str = str(buf, "utf-8")
 
     if not prot._iso_dates:
         return ts_str
 
+    try:
+        return datetime(*_ts_vals_from_txt(ts_str, len(ts_str)))
+    except ValueError:
+        pass
+
     match = timestamp_re.match(ts_str)
     if not match:
         return ts_str
@@ -285,7 +323,7 @@ def txt_timestamp_to_python(
     if usec is None:
         usec = 0
     else:
-        usec = int(usec + "0" * (6 - len(usec)))
+        usec = int(usec.ljust(6, "0"))
     try:
         return datetime(  # type: ignore
             *(int(g) for g in match.groups()[:6]), usec)  # type:ignore
@@ -300,6 +338,30 @@ timestamptz_re = re.compile(
     re.ASCII)
 
 
+def _tz_from_txt(tz_str: str) -> timezone:
+    # Parses an offset in the form "(-+)HH[:MM[:SS]]". Raises ValueError for
+    # any other layout.
+    tz_len = len(tz_str)
+    if tz_len == 3:
+        hours, minutes, seconds = tz_str[1:3], "0", "0"
+    elif tz_len == 6 and tz_str[3] == ":":
+        hours, minutes, seconds = tz_str[1:3], tz_str[4:6], "0"
+    elif tz_len == 9 and tz_str[3] == ":" and tz_str[6] == ":":
+        hours, minutes, seconds = tz_str[1:3], tz_str[4:6], tz_str[7:9]
+    else:
+        raise ValueError("Unexpected timezone layout")
+    if not (tz_str.isascii() and hours.isdigit() and minutes.isdigit() and
+            seconds.isdigit()):
+        raise ValueError("Unexpected timezone layout")
+    tz_delta = timedelta(
+        hours=int(hours), minutes=int(minutes), seconds=int(seconds))
+    if tz_str[0] == "-":
+        tz_delta *= -1
+    elif tz_str[0] != "+":
+        raise ValueError("Unexpected timezone layout")
+    return timezone(tz_delta)
+
+
 def txt_timestamptz_to_python(
         prot: 'pagio.base_protocol._AbstractPGProtocol',
         buf: memoryview,
@@ -309,11 +371,22 @@ def txt_timestamptz_to_python(
     # String is in the form
     # "YYYY[YY..]-MM-DD HH:MM:SS[.U{1,6}](-+)HH[:MM[:SS]][ BC]"
     # Python datetime range can only handle 4 digit year without 'BC' suffix
-    ts_str = decode(buf)
+    ts_str = str(buf, "utf-8")
     if not prot._iso_dates:
         return ts_str
     tzinfo = prot._tzinfo
 
+    # The offset starts at the last plus or minus sign
+    tz_pos = max(ts_str.rfind("+"), ts_str.rfind("-"))
+    if tz_pos >= 19:
+        try:
+            ts_vals = _ts_vals_from_txt(ts_str, tz_pos)
+            ts_tz = _tz_from_txt(ts_str[tz_pos:])
+            return datetime(
+                *ts_vals, tzinfo=ts_tz if tzinfo is None else tzinfo)
+        except ValueError:
+            pass
+
     match = timestamptz_re.match(ts_str)
     if match:
         usec = match.group(7)
@@ -321,7 +394,7 @@ def txt_timestamptz_to_python(
             usec = 0
         else:
             # compensate for missing trailing zeroes
-            usec = int(usec + "0" * (6 - len(usec)))
+            usec = int(usec.ljust(6, "0"))
 
         try:
             if tzinfo is None:
@@ -340,67 +413,70 @@ def txt_timestamptz_to_python(
     return ts_str
 
 
-def bin_timestamp_to_python(
-        prot: 'pagio.base_protocol._AbstractPGProtocol',
-        buf: memoryview,
-) -> Union[str, datetime]:
-    """ Converts PG binary timestamp value to Python datetime """
-    value = bin_int8_to_python(prot, buf)
-
-    # special values
-    if value == 0x7FFFFFFFFFFFFFFF:
-        return 'infinity'
-    if value == -0x8000000000000000:
-        return '-infinity'
-    pg_ordinal, time_val = divmod(value, USECS_PER_DAY)
-    hour, minute, sec, usec = _time_vals_from_int(time_val)
+# zero padded strings for the two digit fields
+two_digits = [f"{i:02}" for i in range(100)]
 
-    if MIN_PG_ORDINAL <= pg_ordinal <= MAX_PG_ORDINAL:
-        return datetime.combine(
-            date.fromordinal(pg_ordinal + DATE_OFFSET),
-            time(hour, minute, sec, usec))
 
-    # Outside python date range, convert to a string identical to PG ISO text
-    # format
+def _ts_str_from_int(value: int, tz_suffix: str) -> str:
+    # Formats a timestamp outside the Python range like the PG ISO output
+    pg_ordinal, time_val = divmod(value, USECS_PER_DAY)
     year, month, day = _date_vals_from_int(pg_ordinal)
+    hour, minute, sec, usec = _time_vals_from_int(time_val)
 
     if year < 1:
-        # display value of negative year including correction for non-existing
-        # year 0
+        # display value of negative year including correction for non
+        # existing year 0
         year = -1 * year + 1
         bc_suffix = " BC"
     else:
         bc_suffix = ""
 
-    # strip trailing millisecond zeroes
-    usec_str = str(usec).rstrip("0") if usec else ""
+    # strip trailing microsecond zeroes
+    usec_str = "." + str(usec).zfill(6).rstrip("0") if usec else ""
 
     return (
-        f"{year:04}-{month:02}-{day:02} {hour:02}:{minute:02}:{sec:02}"
-        f"{usec_str}{bc_suffix}")
+        str(year).zfill(4) + "-" + two_digits[month] + "-" +
+        two_digits[day] + " " + two_digits[hour] + ":" +
+        two_digits[minute] + ":" + two_digits[sec] + usec_str + tz_suffix +
+        bc_suffix)
 
 
-def bin_timestamptz_to_python(
+def bin_timestamp_to_python(
         prot: 'pagio.base_protocol._AbstractPGProtocol',
         buf: memoryview,
 ) -> Union[str, datetime]:
     """ Converts PG binary timestamp value to Python datetime """
-    value = bin_int8_to_python(prot, buf)
+    if len(buf) != 8:
+        raise ProtocolError("Invalid timestamp length.")
+    value = int.from_bytes(buf, "big", signed=True)
+
+    if MIN_PG_TIMESTAMP <= value <= MAX_PG_TIMESTAMP:
+        # within Python datetime range
+        return PG_EPOCH + timedelta(microseconds=value)
 
     # special values
     if value == 0x7FFFFFFFFFFFFFFF:
         return 'infinity'
     if value == -0x8000000000000000:
         return '-infinity'
+    # Outside python date range, convert to a string identical to PG ISO text
+    # format
+    return _ts_str_from_int(value, "")
+
+
+def bin_timestamptz_to_python(
+        prot: 'pagio.base_protocol._AbstractPGProtocol',
+        buf: memoryview,
+) -> Union[str, datetime]:
+    """ Converts PG binary timestamp value to Python datetime """
+    if len(buf) != 8:
+        raise ProtocolError("Invalid timestamp length.")
+    value = int.from_bytes(buf, "big", signed=True)
 
     tzinfo = prot._tzinfo
     if MIN_PG_TIMESTAMP <= value <= MAX_PG_TIMESTAMP:
         # UTC value is within Python range
-        pg_ordinal, time_val = divmod(value, USECS_PER_DAY)
-        hour, minute, sec, usec = _time_vals_from_int(time_val)
-        timestamp = datetime.combine(
-            date.fromordinal(pg_ordinal + DATE_OFFSET),
-            time(hour, minute, sec, usec), tzinfo=timezone.utc)
+        timestamp = PG_EPOCH_UTC + timedelta(microseconds=value)
         if tzinfo is not None:
             try:
                 timestamp = timestamp.astimezone(tzinfo)
@@ -408,6 +484,12 @@ def bin_timestamptz_to_python(
                 pass
         return timestamp
 
+    # special values
+    if value == 0x7FFFFFFFFFFFFFFF:
+        return 'infinity'
+    if value == -0x8000000000000000:
+        return '-infinity'
+
     if tzinfo is not None and (
             value < MIN_PG_TIMESTAMP or value > MAX_PG_TIMESTAMP):
         # Edge case. UTC value is outside Python range, but with the session
@@ -434,24 +516,7 @@ def bin_timestamptz_to_python(
 
     # Outside python date range, convert to a string identical to PG ISO text
     # format
-    pg_ordinal, time_val = divmod(value, USECS_PER_DAY)
-    year, month, day = _date_vals_from_int(pg_ordinal)
-    hour, minute, sec, usec = _time_vals_from_int(time_val)
-
-    if year < 1:
-        # display value of negative year including correction for non
-        # existing year 0
-        year = -1 * year + 1
-        bc_suffix = " BC"
-    else:
-        bc_suffix = ""
-
-    # strip trailing millisecond zeroes
-    usec_str = f".{str(usec).rstrip('0')}" if usec else ""
-
-    return (
-        f"{year:04}-{month:02}-{day:02} {hour:02}:{minute:02}:{sec:02}"
-        f"{usec_str}+00{bc_suffix}")
+    return _ts_str_from_int(value, "+00")
 
 
 def datetime_to_pg(val: datetime) -> Tuple[int, str, int, int, Format]:
@@ -500,7 +565,7 @@ def txt_interval_to_python(
         buf: memoryview,
 ) -> Union[Tuple[int, timedelta], str]:
 
-    str_val = decode(buf)
+    str_val = str(buf, "utf-8")
     if prot._interval_style != "postgres":
         return str_val
 
@@ -553,6 +618,7 @@ def timedelta_to_pg(val: timedelta) -> Tuple[int, str, bytes, int, Format]:
 
 class PGTimestampArray(PGArray):
     oid = TIMESTAMPARRAYOID
+    __slots__ = ()
 
     def _val_to_str(self, val: datetime) -> str:
         return val.isoformat()
@@ -560,11 +626,14 @@ class PGTimestampArray(PGArray):
 
 class PGTimestampTZArray(PGTimestampArray):
     oid = TIMESTAMPTZARRAYOID
+    __slots__ = ()
 
 
 class PGDateArray(PGTimestampArray):
     oid = DATEARRAYOID
+    __slots__ = ()
 
 
 class PGTimeArray(PGTimestampArray):
     oid = TIMEARRAYOID
+    __slots__ = ()
@@ -1,15 +1,17 @@
 """ Network type conversion functions """
 
 from codecs import decode
+from functools import lru_cache
 from ipaddress import (
     ip_interface, ip_network, IPv4Interface, IPv6Interface, IPv4Network,
     IPv6Network, IPv4Address, IPv6Address)
+from struct import Struct
 from typing import Union, Callable, Any, cast, Tuple
 
 import pagio
 
 from .array import PGArray
-from ..common import ProtocolError, check_length_equal, Format, uint_from_bytes
+from ..common import ProtocolError, check_length_equal, Format
 from ..const import INETOID, CIDROID, INETARRAYOID
 from .text import str_to_pg
 
@@ -33,45 +35,72 @@ def txt_cidr_to_python(
 PGSQL_AF_INET = 2
 PGSQL_AF_INET6 = 3
 
+ipv4_struct = Struct("!4BI")
+ipv6_struct = Struct("!4B16s")
+
+
+# Address objects are immutable and the same addresses tend to come back in
+# many rows, so the constructed values are cached.
+@lru_cache(maxsize=1024)
+def _cached_ip_interface(
+        addr_data: Union[int, bytes], mask: int,
+) -> Union[IPv4Interface, IPv6Interface]:
+    return ip_interface((addr_data, mask))
+
+
+@lru_cache(maxsize=1024)
+def _cached_ip_network(
+        addr_data: Union[int, bytes], mask: int,
+) -> Union[IPv4Network, IPv6Network]:
+    return ip_network((addr_data, mask))
+
+
+def clear_ip_cache() -> None:
+    """ Clears the cache of converted binary inet and cidr values """
+    _cached_ip_interface.cache_clear()
+    _cached_ip_network.cache_clear()
+
 
 def bin_ip_to_python(
         buf: memoryview,
         cidr: int,
-        cons: Callable[[Any], Any],
+        cons: Callable[[Union[int, bytes], int], Any],
 ) -> Any:
-    family, mask, is_cidr, size = buf[:4]
-
-    if is_cidr != cidr:
-        raise ProtocolError("Wrong value for cidr flag")
+    if not buf:
+        raise ProtocolError("Invalid address family")
+    family = buf[0]
 
     addr_data: Union[int, bytes]
     if family == PGSQL_AF_INET:
+        check_length_equal(8, buf)
+        _, mask, is_cidr, size, addr_data = ipv4_struct.unpack(buf)
         if size != 4:
             raise ProtocolError("Invalid IPv4 value.")
-        check_length_equal(8, buf)
-        addr_data = uint_from_bytes(buf[4:8])
     elif family == PGSQL_AF_INET6:
+        check_length_equal(20, buf)
+        _, mask, is_cidr, size, addr_data = ipv6_struct.unpack(buf)
         if size != 16:
             raise ProtocolError("Invalid IPv6 value.")
-        check_length_equal(20, buf)
-        addr_data = bytes(buf[4:])
     else:
         raise ProtocolError("Invalid address family")
-    return cons((addr_data, mask))
+
+    if is_cidr != cidr:
+        raise ProtocolError("Wrong value for cidr flag")
+    return cons(addr_data, mask)
 
 
 def bin_inet_to_python(
         prot: 'pagio.base_protocol._AbstractPGProtocol',
         buf: memoryview,
 ) -> Any:
-    return bin_ip_to_python(buf, 0, ip_interface)
+    return bin_ip_to_python(buf, 0, _cached_ip_interface)
 
 
 def bin_cidr_to_python(
         prot: 'pagio.base_protocol._AbstractPGProtocol',
         buf: memoryview,
 ) -> Any:
-    return bin_ip_to_python(buf, 1, ip_network)
+    return bin_ip_to_python(buf, 1, _cached_ip_network)
 
 
 Inet = Union[IPv4Address, IPv6Address, IPv4Interface, IPv6Interface]
@@ -93,6 +122,7 @@ class PGInet:  # pylint: disable=too-few-public-methods
     """ Class to facilitate JSON PG parameter """
 
     oid = INETOID
+    __slots__ = ("_val",)
 
     def __init__(self, val: Union[str, Inet]) -> None:
         if not isinstance(
@@ -109,3 +139,4 @@ class PGInet:  # pylint: disable=too-few-public-methods
 
 class PGInetArray(PGArray):
     oid = INETARRAYOID
+    __slots__ = ()
@@ -1,22 +1,20 @@
 """ Numeric conversions """
 import struct
-from codecs import decode
 from ctypes import c_float
 from decimal import Decimal
 from struct import Struct
-from typing import Tuple, Any, Generator, Union, List, cast, Callable
+from typing import Tuple, Any, Union, List, Dict, cast, Callable
 
 import pagio
 
 from .. import const
-from .array import PGArray, parse_unquoted
-from .conv_utils import comma
-from ..common import Format, ProtocolError, uint_from_bytes
+from .array import PGArray
+from ..common import Format, ProtocolError
 from ..const import (
     INT4ARRAYOID, BOOLARRAYOID, NUMERICARRAYOID, NUMRANGEOID, FLOAT8ARRAYOID,
     FLOAT4ARRAYOID,
 )
-from .conv_utils import simple_int, ResConverter, right_parens
+from .conv_utils import ResConverter, right_parens
 from .range import DiscreteRange, BasePGRange, BaseMultiRange
 from .text import default_to_pg
 
@@ -77,7 +75,7 @@ def txt_intvector_to_python(
         prot: 'pagio.base_protocol._AbstractPGProtocol',
         buf: memoryview,
 ) -> List[int]:
-    return [int(v) for v in decode(buf).split(' ')]
+    return [int(v) for v in bytes(buf).split(b' ')]
 
 
 # ======== float ============================================================ #
@@ -108,15 +106,33 @@ def txt_numeric_to_python(
         buf: memoryview,
 ) -> Decimal:
     """ Converts a PG numeric text value to a Python Decimal """
-    return Decimal(decode(buf))
+    return Decimal(str(buf, "ascii"))
 
 
 numeric_header = Struct("!HhHH")
+# decimal digits of every possible postgres digit
+pg_digit_strs = [f"{d:04}" for d in range(10000)]
+# compiled structs for binary numeric values by number of pg_digits
+numeric_structs: Dict[int, Struct] = {}
 NUMERIC_NAN = 0xC000
 NUMERIC_POS = 0x0000
 NUMERIC_NEG = 0x4000
 NUMERIC_PINF = 0xD000
 NUMERIC_NINF = 0xF000
+numeric_specials = {
+    NUMERIC_NAN: Decimal("NaN"),
+    NUMERIC_PINF: Decimal("inf"),
+    NUMERIC_NINF: Decimal("-inf"),
+}
+
+
+def get_numeric_struct(npg_digits: int) -> Struct:
+    """ Gets the compiled struct for a numeric with npg_digits digits """
+    numeric_struct = numeric_structs.get(npg_digits)
+    if numeric_struct is None:
+        numeric_struct = numeric_structs[npg_digits] = Struct(
+            f"!HhHH{npg_digits}H")
+    return numeric_struct
 
 
 def bin_numeric_to_python(
@@ -127,36 +143,28 @@ def bin_numeric_to_python(
 
     npg_digits, weight, sign, _ = numeric_header.unpack_from(buf)
 
-    if sign == NUMERIC_NAN:
-        return Decimal("NaN")
-    if sign == NUMERIC_PINF:
-        return Decimal("inf")
-    if sign == NUMERIC_NINF:
-        return Decimal("-inf")
-
-    if sign == NUMERIC_NEG:
+    if sign == NUMERIC_POS:
+        sign = 0
+    elif sign == NUMERIC_NEG:
         sign = 1
-    elif sign != NUMERIC_POS:
-        raise Exception('Bad value')
-
-    buf = buf[numeric_header.size:]
-
-    def get_digits() -> Generator[int, None, None]:
-        for i in range(npg_digits):
-            pg_digit = uint_from_bytes(buf[i * 2: i * 2 + 2])
-            if pg_digit > 9999:
-                raise ValueError("Invalid value")
-            # a postgres digit contains 4 decimal digits
-            quot, rest = divmod(pg_digit, 1000)
-            yield quot
-            quot, rest = divmod(rest, 100)
-            yield quot
-            yield from divmod(rest, 10)
-
-    digits = tuple(get_digits())
+    else:
+        special = numeric_specials.get(sign)
+        if special is None:
+            raise ProtocolError("Invalid numeric sign.")
+        return special
+
+    numeric_struct = get_numeric_struct(npg_digits)
+    if len(buf) != numeric_struct.size:
+        raise ProtocolError("Invalid numeric value.")
+    pg_digits = numeric_struct.unpack(buf)[4:]
+    if pg_digits and max(pg_digits) > 9999:
+        raise ValueError("Invalid value")
+    # A postgres digit contains 4 decimal digits. Let Decimal parse the digits
+    # as a string, which is done in C in one go.
+    digits = "".join(map(pg_digit_strs.__getitem__, pg_digits)) or "0"
     exp = (weight + 1 - npg_digits) * 4
 
-    return Decimal((sign, digits, exp))
+    return Decimal(f"{'-' if sign else ''}{digits}E{exp}")
 
 
 def numeric_to_pg(val: Decimal) -> Tuple[int, str, bytes, int, Format]:
@@ -228,8 +236,7 @@ def numeric_to_pg(val: Decimal) -> Tuple[int, str, bytes, int, Format]:
             pg_sign = NUMERIC_PINF
 
     npg_digits = len(pg_digits)
-    byte_val = struct.pack(
-        "!HhHH" + npg_digits * "H",
+    byte_val = get_numeric_struct(npg_digits).pack(
         npg_digits, pg_weight, pg_sign, pg_scale, *pg_digits)
     len_val = len(byte_val)
     return const.NUMERICOID, f"{len_val}s", byte_val, len_val, Format.BINARY
@@ -276,20 +283,16 @@ def txt_tid_to_python(
         prot: 'pagio.base_protocol._AbstractPGProtocol',
         buf: memoryview,
 ) -> Tuple[int, int]:
-    if buf[0] != left_parens:
-        raise ProtocolError("Invalid tid value.")
-    pos = 1
-    num1, new_pos = parse_unquoted(buf[pos:], [comma], prot, simple_int)
-    pos += new_pos
-    pos += 1
-    num2, new_pos = parse_unquoted(buf[pos:], [right_parens], prot, simple_int)
-    pos += new_pos
-    pos += 1
-    if pos != len(buf):
+    if len(buf) < 2 or buf[0] != left_parens or buf[-1] != right_parens:
         raise ProtocolError("Invalid tid value.")
-    if num1 is None or num2 is None:
+    # parse the digits straight from the bytes, int() accepts those
+    parts = bytes(buf[1:-1]).split(b",")
+    if len(parts) != 2:
         raise ProtocolError("Invalid tid value.")
-    return num1, num2
+    try:
+        return int(parts[0]), int(parts[1])
+    except ValueError as ex:
+        raise ProtocolError("Invalid tid value.") from ex
 
 
 tid_struct_unpack: Callable[
@@ -309,22 +312,27 @@ def bin_tid_to_python(
 
 class PGInt4Array(PGArray):
     oid = INT4ARRAYOID
+    __slots__ = ()
 
 
 class PGBoolArray(PGArray):
     oid = BOOLARRAYOID
+    __slots__ = ()
 
 
 class PGNumericArray(PGArray):
     oid = NUMERICARRAYOID
+    __slots__ = ()
 
 
 class PGFloat8Array(PGArray):
     oid = FLOAT8ARRAYOID
+    __slots__ = ()
 
 
 class PGFloat4Array(PGArray):
     oid = FLOAT4ARRAYOID
+    __slots__ = ()
 
 
 class PGIntRange(DiscreteRange[int]):
@@ -89,6 +89,7 @@ def uuid_to_pg(val: UUID) -> Tuple[int, str, bytes, int, Format]:
 
 class PGUUIDArray(PGArray):
     oid = UUIDARRAYOID
+    __slots__ = ()
 
 
 # ======== text ============================================================= #
@@ -116,7 +117,7 @@ def txt_json_to_python(
         buf: memoryview,
 ) -> Any:
     """ Converts textual PG json to Python """
-    return loads(decode(buf))
+    return loads(str(buf, "utf-8"))
 
 
 def bin_jsonb_to_python(
@@ -126,13 +127,14 @@ def bin_jsonb_to_python(
     """ Converts binary PG jsonb to Python """
     if buf[0] != 1:
         raise ProtocolError("Invalid jsonb version")
-    return loads(decode(buf[1:]))
+    return loads(str(buf[1:], "utf-8"))
 
 
 class PGJson:  # pylint: disable=too-few-public-methods
     """ Class to facilitate JSON PG parameter """
 
     oid = JSONBOID
+    __slots__ = ("_val", "_encoder")
 
     def __init__(
             self,
@@ -166,7 +168,9 @@ class PGRegConfig(str):
 
 class PGTextArray(PGArray):
     oid = TEXTARRAYOID
+    __slots__ = ()
 
 
 class PGJsonArray(PGArray):
     oid = JSONBARRAYOID
+    __slots__ = ()
@@ -1,7 +1,7 @@
 from ssl import SSLSocket, SSLObject
 from typing import Union, List, Tuple, Optional
 
-from . import core, utils
+from . import core
 
 class ScramClient:
 
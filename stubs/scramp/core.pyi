@@ -4,9 +4,9 @@ from typing import Callable, Any
 def _make_salted_password(
         hf: Callable[[], Any],
         password: str,
-        salt: bytes,
+        salt: Any,
         iterations: int,
-    ) -> str:
+    ) -> bytes:
     ...
 
 
@@ -118,11 +118,19 @@ class ConnCase(IsolatedAsyncioTestCase):
        ) as cn:
            await cn.execute("SELECT 1 AS val")
            await cn.execute("SELECT 1 AS val")
-           res = await cn.execute("SELECT COUNT(*) FROM pg_prepared_statements")
+           check_sql = (
+               "SELECT COUNT(*) FROM pg_prepared_statements "
+               "WHERE statement = 'SELECT 1 AS val'")
+           res = await cn.execute(check_sql)
            self.assertEqual(res.rows[0][0], 1)
            for i in range(10):
                await cn.execute(f"SELECT {i}")
-           res = await cn.execute("SELECT COUNT(*) FROM pg_prepared_statements")
+           res = await cn.execute(check_sql)
+           self.assertEqual(res.rows[0][0], 1)
+           for i in range(10):
+               await cn.execute(f"SELECT {i} AS num")
+               await cn.execute(f"SELECT {i} AS num")
+           res = await cn.execute(check_sql)
            self.assertEqual(res.rows[0][0], 0)
            await cn.execute(f"SELECT 100")
 
@@ -136,24 +136,32 @@ class ConnCase(unittest.TestCase):
             cn.execute("SELECT 1 AS val")
 
             # executed twice, so should be prepared now
-            res = cn.execute("SELECT COUNT(*) FROM pg_prepared_statements")
+            check_sql = (
+                "SELECT COUNT(*) FROM pg_prepared_statements "
+                "WHERE statement = 'SELECT 1 AS val'")
+            res = cn.execute(check_sql)
             self.assertEqual(res.rows[0][0], 1)
 
-            # move statement out of cache by executing other statements
+            # single use statements do not push prepared statement out of cache
             for i in range(9):
                 cn.execute(f"SELECT {i}")
+            res = cn.execute(check_sql)
+            self.assertEqual(res.rows[0][0], 1)
+
+            # move statement out of cache by executing other statements
+            for i in range(10):
+                cn.execute(f"SELECT {i} AS num")
+                cn.execute(f"SELECT {i} AS num")
 
             # verify it is not prepared anymore
-            res = cn.execute(
-                "SELECT COUNT(*) AS num FROM pg_prepared_statements")
+            res = cn.execute(check_sql)
             self.assertEqual(res.rows[0][0], 0)
 
             cn.execute("SELECT 1 AS val")
             cn.execute("SELECT 1 AS val")
 
             # executed twice, so should be prepared now
-            res = cn.execute(
-                "SELECT COUNT(*) AS num2 FROM pg_prepared_statements")
+            res = cn.execute(check_sql)
             self.assertEqual(res.rows[0][0], 1)
 
             # cn.execute("PREPARE myplan AS SELECT 2 AS val;")
@@ -1,5 +1,6 @@
 from datetime import date, datetime, timezone, timedelta, time
 from decimal import Decimal
+from types import SimpleNamespace
 from ipaddress import (
     IPv4Interface, IPv6Interface, IPv4Network, IPv6Network, IPv4Address,
     IPv6Address)
@@ -13,6 +14,7 @@ from pagio import (
     PGInt4MultiRange, PGInt8MultiRange, PGNumMultiRange,
 )
 from pagio.types import txt_hstore_to_python, bin_hstore_to_python
+from pagio.types.dt import txt_timestamp_to_python, txt_timestamptz_to_python
 from pagio.zoneinfo import ZoneInfo
 
 
@@ -315,6 +317,9 @@ class ConnTypeCase(unittest.TestCase):
         self._test_val_result(
             "SELECT '0002-03-15 14:10:03 BC'::timestamp",
             '0002-03-15 14:10:03 BC')
+        self._test_val_result(
+            "SELECT '0002-03-15 14:10:03.00005 BC'::timestamp",
+            '0002-03-15 14:10:03.00005 BC')
         self._test_val_result(
             "SELECT 'infinity'::timestamp", 'infinity')
         self._test_val_result(
@@ -806,3 +811,27 @@ class PyConnTypeCase(ConnTypeCase):
     @classmethod
     def tearDownClass(cls) -> None:
         sync_connection.PGProtocol = sync_protocol.PGProtocol
+
+
+class TxtTimestampCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._prot = SimpleNamespace(_iso_dates=True, _tzinfo=None)
+
+    def test_malformed_timestamp(self):
+        # Python int() would accept these fields, PG never sends them
+        for val in [
+                "2021-03-15 14:10:03.+12", "2_21-03-15 14:10:03",
+                "2021-03-15 14:10: 3", "\uff12\uff10\uff12\uff11-03-15 14:10:03"]:
+            self.assertEqual(
+                txt_timestamp_to_python(self._prot, memoryview(val.encode())),
+                val)
+
+    def test_malformed_timestamptz(self):
+        for val in [
+                "2021-03-15 14:10:03+ 1", "2021-03-15 14:10:03+01:_3",
+                "2021-03-15 14:10:03.+1+01"]:
+            self.assertEqual(
+                txt_timestamptz_to_python(
+                    self._prot, memoryview(val.encode())),
+                val)
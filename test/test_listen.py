@@ -1,5 +1,6 @@
 import asyncio
 from threading import Thread
+from time import sleep
 import unittest
 
 try:
@@ -47,6 +48,32 @@ class ListenCase(unittest.TestCase):
             with self.assertRaises(QueueEmpty):
                 cn.notifications.get(0.1)
 
+    def test_timeout_after_other_data(self):
+
+        class SlowProtocol:
+            # Protocol wrapper, where a poll handles other data than a
+            # notification and takes longer than the timeout
+            def __init__(self, protocol):
+                self._protocol = protocol
+
+            def __getattr__(self, name):
+                return getattr(self._protocol, name)
+
+            def poll(self):
+                sleep(0.2)
+
+        with Connection(database="postgres") as cn:
+            cn.execute("LISTEN chan")
+            notifications = cn.notifications
+            protocol = notifications._protocol
+            notifications._protocol = SlowProtocol(protocol)
+            try:
+                with self.assertRaises(QueueEmpty):
+                    notifications.get(0.1)
+            finally:
+                notifications._protocol = protocol
+            self.assertIsNone(protocol.sock.gettimeout())
+
 
 class PyListenCase(ListenCase):
     @classmethod
@@ -0,0 +1,95 @@
+import hashlib
+import hmac
+import unittest
+
+import scramp
+
+from pagio.pgscramp import (
+    PGScrampClient, _salted_pwd_cache, clear_salted_password_cache)
+
+MECHANISM = "SCRAM-SHA-256"
+
+
+def raw_auth_info(password, salt=b"0123456789abcdef", iterations=4096):
+    # Server side authentication info derived from the raw password bytes,
+    # like PostgreSQL does when the password can not be prepared.
+    salted = hashlib.pbkdf2_hmac("sha256", password, salt, iterations)
+    client_key = hmac.digest(salted, b"Client Key", "sha256")
+    stored_key = hashlib.sha256(client_key).digest()
+    server_key = hmac.digest(salted, b"Server Key", "sha256")
+    return salt, stored_key, server_key, iterations
+
+
+def authenticate(client, auth_info):
+    server = scramp.ScramMechanism(MECHANISM).make_server(
+        lambda username: auth_info)
+    server.set_client_first(client.get_client_first())
+    client.set_server_first(server.get_server_first())
+    server.set_client_final(client.get_client_final())
+    client.set_server_final(server.get_server_final())
+
+
+class ScramCase(unittest.TestCase):
+
+    def test_exchange(self):
+        auth_info = scramp.ScramMechanism(MECHANISM).make_auth_info(
+            "secret", iteration_count=4096)
+        authenticate(PGScrampClient([MECHANISM], b"secret", None), auth_info)
+
+    def test_other_scramp_users(self):
+        # pagio patches scramp
+        authenticate(
+            PGScrampClient([MECHANISM], b"\xff", None),
+            raw_auth_info(b"\xff"))
+
+        # regular scramp usage is not affected
+        mechanism = scramp.ScramMechanism(MECHANISM)
+        auth_info = mechanism.make_auth_info("secret", iteration_count=4096)
+        authenticate(
+            scramp.ScramClient([MECHANISM], "user", "secret"), auth_info)
+        with self.assertRaises(scramp.ScramException):
+            authenticate(
+                scramp.ScramClient([MECHANISM], "user", "wrong"), auth_info)
+
+    def test_cached_salted_password(self):
+        clear_salted_password_cache()
+        auth_info = scramp.ScramMechanism(MECHANISM).make_auth_info(
+            "secret", iteration_count=4096)
+        authenticate(PGScrampClient([MECHANISM], b"secret", None), auth_info)
+        self.assertEqual(len(_salted_pwd_cache), 1)
+        cached = dict(_salted_pwd_cache)
+        authenticate(PGScrampClient([MECHANISM], b"secret", None), auth_info)
+        self.assertEqual(_salted_pwd_cache, cached)
+
+        # the password itself is not kept
+        self.assertNotIn(b"secret", next(iter(cached)))
+
+        clear_salted_password_cache()
+        self.assertEqual(len(_salted_pwd_cache), 0)
+
+    def test_regular_password(self):
+        auth_info = scramp.ScramMechanism(MECHANISM).make_auth_info(
+            "pässwörd", iteration_count=4096)
+        client = PGScrampClient([MECHANISM], "pässwörd".encode(), None)
+        authenticate(client, auth_info)
+
+    def test_prepared_password(self):
+        # saslprep maps the roman numeral to plain "IX"
+        auth_info = scramp.ScramMechanism(MECHANISM).make_auth_info(
+            "IX", iteration_count=4096)
+        client = PGScrampClient([MECHANISM], "\u2168".encode(), None)
+        authenticate(client, auth_info)
+
+    def test_non_utf8_password(self):
+        client = PGScrampClient([MECHANISM], b"p\xe4ssw\xf6rd", None)
+        authenticate(client, raw_auth_info(b"p\xe4ssw\xf6rd"))
+
+    def test_saslprep_rejected_password(self):
+        # control characters are prohibited by saslprep
+        client = PGScrampClient([MECHANISM], b"pass\x07word", None)
+        authenticate(client, raw_auth_info(b"pass\x07word"))
+
+    def test_wrong_password(self):
+        client = PGScrampClient([MECHANISM], b"\xffwrong", None)
+        with self.assertRaises(scramp.ScramException):
+            authenticate(client, raw_auth_info(b"\xffsecret"))